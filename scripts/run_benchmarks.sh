@@ -7,7 +7,7 @@
 #   - perf on PATH (for TLB and cache miss events)
 #   - tracy-capture on PATH
 #   - tracy-csvexport on PATH (exports each .tracy to .csv)
-#   - Python 3 with plotly (for scripts/visualize_benchmarks.py)
+#   - Python 3 with plotly and pandas (for scripts/visualize_benchmarks.py); orjson is optional and speeds up JSON handling
 #
 # Usage: run from project root, or pass project root as first argument.
 
@@ -5,18 +5,36 @@ Shows the effect of queue size and producer count on throughput.
 All measurements are taken within 1 second, so successfulPops represents throughput (MOps/sec).
 """
 
+from __future__ import annotations
+
 import argparse
-import csv
+import functools
+import hashlib
 import json
+import pickle
 import re
-import plotly.graph_objects as go  # type: ignore[import-not-found]
-import plotly.express as px  # type: ignore[import-not-found]
-import plotly.io as pio  # type: ignore[import-not-found]
+import string
+import numpy as np  # type: ignore[import-not-found]
 from html import escape as html_escape
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, Callable, List
 from pathlib import Path
 from collections import defaultdict
 import logging
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# pandas and plotly are imported inside the functions that use them, so --help and error exits skip
+# both, and cached-figure runs skip pandas (a few hundred ms on a cold interpreter); those still need
+# plotly for the cache key and to unpickle the figures.
+if TYPE_CHECKING:
+    import pandas as pd  # type: ignore[import-not-found]
+    import plotly.graph_objects as go  # type: ignore[import-not-found]
+
+_json_fast: Any
+try:
+    import orjson as _json_fast  # type: ignore[import-not-found]
+except ImportError:
+    _json_fast = None
 
 # Glob pattern for per-queue-size result files produced by run_benchmarks.sh
 BENCHMARK_RESULTS_GLOB = 'benchmark_results_q*.json'
@@ -25,190 +43,239 @@ TRACY_CSV_GLOB = 'tracy_q*.csv'
 # Perf stat output files (perf_q<queue_size>_p<producer_count>.txt)
 PERF_TXT_GLOB = 'perf_q*.txt'
 
+# Tracy CSV columns we load, grouped by parsed type
+TRACY_TEXT_COLUMNS = ('name', 'src_file')
+TRACY_INT_COLUMNS = ('src_line', 'counts')
+TRACY_FLOAT_COLUMNS = ('total_ns', 'total_perc', 'mean_ns', 'min_ns', 'max_ns', 'std_ns')
+TRACY_CSV_COLUMNS = TRACY_TEXT_COLUMNS + TRACY_INT_COLUMNS + TRACY_FLOAT_COLUMNS
+
 # Perf metric names (we match event names containing these substrings)
 PERF_METRICS = {
     'dTLB-load-misses': 'dTLB-load-misses',
     'iTLB-load-misses': 'iTLB-load-misses',
 }
+# Perf event name -> PERF_METRICS key
+_EVENT_TO_KEY = {v: k for k, v in PERF_METRICS.items()}
+
+# successfulPops -> MOps/sec (0.5 seconds is the duration of the benchmark)
+_MOPS_SCALE = 1.0 / 0.5e6
+# Above this many heatmap cells the per-cell value labels (one SVG text node each) are dropped; hover still shows them.
+_HEATMAP_TEXT_MAX_CELLS = 200
+# Line plots with more points than this draw their markers with WebGL (scattergl) instead of one SVG node each
+_SCATTERGL_MIN_POINTS = 1000
+# Line traces longer than this are decimated to this many points (LTTB) before plotting
+_LINE_MAX_POINTS = 500
+# Lines with more points than this mark only every _SPARSE_MARKER_STEP-th point (one SVG node per marker)
+_MARKERS_MAX_POINTS = 12
+_SPARSE_MARKER_STEP = 5
+
+# Filename / perf line patterns, compiled once (used as sort keys over every result file)
+_BENCH_RE = re.compile(r'benchmark_results_q(\d+)(?:_p(\d+))?\.json')
+_TRACY_RE = re.compile(r'tracy_q(\d+)(?:_p(\d+))?\.csv')
+_PERF_RE = re.compile(r'perf_q(\d+)_p(\d+)\.txt')
+# perf stat counter line for one of our metrics, e.g. '        58180      dTLB-load-misses:u'.
+# Lines like '<not supported>' never match, so a whole file is scanned in one finditer pass.
+_PERF_METRIC_RE = re.compile(
+    r'^[ \t]*(\d+)[ \t]+(' + '|'.join(re.escape(v) for v in PERF_METRICS.values()) + r')(?::\S*)?[ \t]*$',
+    re.MULTILINE,
+)
 
 
 def load_benchmark_json(json_path: Path) -> dict[str, Any]:
-    """Load the full benchmark JSON payload."""
-    with open(json_path, 'r') as f:
-        return json.load(f)
+    """Load the full benchmark JSON payload (parsed straight from bytes, with orjson when available)."""
+    data = json_path.read_bytes()
+    if _json_fast is not None:
+        return _json_fast.loads(data)
+    return json.loads(data)
+
+
+def benchmark_results(payload: dict[str, Any]) -> list[dict[str, Any]]:
+    """The benchmarkResults of a parsed payload as a list (a file with one run may store a single object)."""
+    results = payload['benchmarkResults']
+    return [results] if isinstance(results, dict) else results
 
 
 def load_benchmark_data(json_path: Path) -> list[dict[str, Any]]:
-    """Load benchmark results list from JSON file."""
-    data = load_benchmark_json(json_path)
-    return data['benchmarkResults']
+    """
+    Load benchmark results list from JSON file.
+    Kept for external callers; when cpuInfo is needed too, parse once with load_benchmark_json
+    and unpack the payload with benchmark_results instead of calling both.
+    """
+    return benchmark_results(load_benchmark_json(json_path))
 
 
-def _benchmark_sort_key(path: Path) -> tuple[int, int]:
+def _parse_benchmark_name(path: Path) -> tuple[int, int]:
     """(queue_size, producer_count) for benchmark_results_q<N>_p<P>.json or benchmark_results_q<N>.json."""
-    m = re.search(r'benchmark_results_q(\d+)(?:_p(\d+))?\.json', path.name)
+    m = _BENCH_RE.search(path.name)
     if not m:
         return 0, 0
-    q, p = int(m.group(1)), int(m.group(2)) if m.group(2) else 0
-    return q, p
+    return int(m[1]), int(m[2] or 0)
 
 
 def _queue_size_from_filename(path: Path) -> int:
     """Extract queue size from benchmark_results_q<N>.json or benchmark_results_q<N>_p<P>.json."""
-    match = re.search(r'benchmark_results_q(\d+)(?:_p\d+)?\.json', path.name)
+    match = _BENCH_RE.search(path.name)
     return int(match.group(1)) if match else 0
 
 
-def _tracy_sort_key(path: Path) -> tuple[int, int]:
-    """(queue_size, producer_count) for tracy_q<N>_p<P>.csv or tracy_q<N>.csv."""
-    m = re.search(r'tracy_q(\d+)(?:_p(\d+))?\.csv', path.name)
+def _parse_tracy_name(path: Path) -> tuple[int, int]:
+    """(queue_size, producer_count) for tracy_q<N>_p<P>.csv or tracy_q<N>.csv (producer_count 0 if no _p)."""
+    m = _TRACY_RE.search(path.name)
     if not m:
         return 0, 0
-    q, p = int(m.group(1)), int(m.group(2)) if m.group(2) else 0
-    return q, p
+    return int(m[1]), int(m[2] or 0)
 
 
-def _queue_size_from_tracy_filename(path: Path) -> int:
-    """Extract queue size from tracy_q<N>.csv or tracy_q<N>_p<P>.csv."""
-    match = re.search(r'tracy_q(\d+)(?:_p\d+)?\.csv', path.name)
-    return int(match.group(1)) if match else 0
+def _scan_results(
+    results_dir: Path, glob: str, parse: Callable[[Path], tuple[int, int] | None],
+) -> list[tuple[tuple[int, int], Path]]:
+    """
+    Glob results_dir and return [((queue_size, producer_count), path), ...] sorted by the parsed name.
+    Each file name is parsed once; paths for which parse returns None are skipped.
+    """
+    found = [(params, p) for p in results_dir.glob(glob) if (params := parse(p)) is not None]
+    found.sort()
+    return found
 
 
-def _producer_count_from_tracy_filename(path: Path) -> int:
-    """Extract producer count from tracy_q<N>_p<P>.csv (0 if no _p)."""
-    match = re.search(r'tracy_q\d+_p(\d+)\.csv', path.name)
-    return int(match.group(1)) if match else 0
+def _map_files(fn: Callable[[Any], Any], items: list[Any]) -> list[Any]:
+    """[fn(item) for item in items], run on a small thread pool when there are several (file reads are I/O bound)."""
+    if len(items) <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1, len(items))) as executor:
+        return list(executor.map(fn, items))
 
 
-def load_all_benchmark_results(results_dir: Path) -> tuple[list[dict[str, Any]], Any]:
+def load_all_benchmark_results(
+    results_dir: Path,
+) -> tuple[list[dict[str, Any]], Any, dict[tuple[int, int], tuple[int, int]]]:
     """
-    Load all benchmark_results_q<size>.json files from results_dir and merge them.
-    Returns (combined_benchmark_results, cpu_info from first file).
+    Load all benchmark_results_q<size>.json files from results_dir (read concurrently) and merge them.
+    Returns (combined_benchmark_results, cpu_info from first file, bench_index) where bench_index
+    maps the (queue_size, producer_count) of each file name to the (queueSize, producerCount) of the
+    first result in that file (plain tuples, so the index keeps no result dicts alive).
     """
-    paths = sorted(results_dir.glob(BENCHMARK_RESULTS_GLOB), key=_benchmark_sort_key)
-    if not paths:
-        return [], None
+    scanned = _scan_results(results_dir, BENCHMARK_RESULTS_GLOB, _parse_benchmark_name)
+    if not scanned:
+        return [], None, {}
 
     combined: list[dict[str, Any]] = []
     cpu_info: Any = None
+    bench_index: dict[tuple[int, int], tuple[int, int]] = {}
 
-    for p in paths:
-        payload = load_benchmark_json(p)
-        results = payload.get('benchmarkResults', [])
-        if isinstance(results, dict):
-            results = [results]
+    payloads = _map_files(lambda entry: load_benchmark_json(entry[1]), scanned)
+    for (params, p), payload in zip(scanned, payloads):
+        results = benchmark_results(payload) if 'benchmarkResults' in payload else []
         combined.extend(results)
+        if results:
+            first = results[0]
+            bench_index.setdefault(params, (first.get('queueSize', params[0]), first.get('producerCount', params[1])))
         if cpu_info is None and payload.get('cpuInfo') is not None:
             cpu_info = payload['cpuInfo']
         logging.info("Loaded %s: %d results", p.name, len(results))
 
-    return combined, cpu_info
+    return combined, cpu_info, bench_index
+
 
+def _read_tracy_csv(path: Path, queue_size: int, producer_count: int) -> pd.DataFrame:
+    """Read one Tracy CSV export, filling missing cells (and missing columns) with 0 / 0.0 / ''."""
+    import pandas as pd  # type: ignore[import-not-found]
 
-def load_all_tracy_csv(results_dir: Path) -> list[dict[str, Any]]:
+    df = pd.read_csv(
+        path,
+        usecols=lambda c: c in TRACY_CSV_COLUMNS,
+        dtype={**{k: 'string' for k in TRACY_TEXT_COLUMNS},
+               **{k: 'Int64' for k in TRACY_INT_COLUMNS},
+               **{k: 'float64' for k in TRACY_FLOAT_COLUMNS}},
+        encoding='utf-8',
+        engine='c',
+    )
+    df = df.reindex(columns=list(TRACY_CSV_COLUMNS))
+    df = df.fillna({**{k: '' for k in TRACY_TEXT_COLUMNS},
+                    **{k: 0 for k in TRACY_INT_COLUMNS},
+                    **{k: 0.0 for k in TRACY_FLOAT_COLUMNS}})
+    df = df.astype({**{k: 'string' for k in TRACY_TEXT_COLUMNS},
+                    **{k: 'int64' for k in TRACY_INT_COLUMNS},
+                    **{k: 'float64' for k in TRACY_FLOAT_COLUMNS}})
+    df.insert(0, 'producer_count', producer_count)
+    df.insert(0, 'queue_size', queue_size)
+    logging.info("Loaded Tracy CSV %s: %d zones", path.name, len(df))
+    return df
+
+
+def _try_read_tracy_csv(path: Path, queue_size: int, producer_count: int) -> pd.DataFrame | None:
     """
-    Load all tracy_q<size>.csv files from results_dir.
-    Returns a flat list of rows with keys: queue_size, name, src_file, src_line,
-    total_ns, total_perc, counts, mean_ns, min_ns, max_ns, std_ns (numeric where applicable).
+    _read_tracy_csv, or None (with a warning) for an empty or unreadable export, so one failed
+    tracy-csvexport does not take down the rest of the report.
     """
-    paths = sorted(results_dir.glob(TRACY_CSV_GLOB), key=_tracy_sort_key)
-    rows: list[dict[str, Any]] = []
-    for p in paths:
-        queue_size = _queue_size_from_tracy_filename(p)
-        producer_count = _producer_count_from_tracy_filename(p)
-        n = 0
-        with open(p, newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                n += 1
-                r: dict[str, Any] = {'queue_size': queue_size, 'producer_count': producer_count}
-                for key in ('name', 'src_file', 'src_line', 'total_ns', 'total_perc',
-                            'counts', 'mean_ns', 'min_ns', 'max_ns', 'std_ns'):
-                    val = row.get(key, '')
-                    if key in ('src_line', 'counts'):
-                        try:
-                            r[key] = int(val) if val else 0
-                        except ValueError:
-                            r[key] = val
-                    elif key in ('total_ns', 'total_perc', 'mean_ns', 'min_ns', 'max_ns', 'std_ns'):
-                        try:
-                            r[key] = float(val) if val else 0.0
-                        except ValueError:
-                            r[key] = val
-                    else:
-                        r[key] = val
-                rows.append(r)
-        logging.info("Loaded Tracy CSV %s: %d zones", p.name, n)
-    return rows
-
+    import pandas as pd  # type: ignore[import-not-found]
 
-def _perf_sort_key(path: Path) -> tuple[int, int]:
-    """(queue_size, producer_count) for perf_q<N>_p<P>.txt."""
-    m = re.search(r'perf_q(\d+)_p(\d+)\.txt', path.name)
-    if not m:
-        return 0, 0
-    return int(m.group(1)), int(m.group(2))
+    try:
+        if path.stat().st_size == 0:
+            logging.warning("Skipping empty Tracy CSV %s", path.name)
+            return None
+        return _read_tracy_csv(path, queue_size, producer_count)
+    except (OSError, UnicodeDecodeError, ValueError, pd.errors.EmptyDataError, pd.errors.ParserError) as e:
+        logging.warning("Skipping unreadable Tracy CSV %s: %s", path.name, e)
+        return None
 
 
-def _parse_perf_counter_line(line: str) -> tuple[str, int] | None:
+def load_all_tracy_csv(results_dir: Path) -> pd.DataFrame:
     """
-    Parse a perf stat counter line like '        58180      dTLB-load-misses:u'.
-    Returns (event_name, value) or None if not parseable (e.g. '<not supported>').
+    Load all tracy_q<size>.csv files from results_dir (read concurrently when there are several).
+    Returns one columnar DataFrame with columns: queue_size, producer_count, name, src_file, src_line,
+    total_ns, total_perc, counts, mean_ns, min_ns, max_ns, std_ns (numeric where applicable).
     """
-    # Match: optional whitespace, number, whitespace, event name (no <not supported>)
-    m = re.match(r'^\s*(\d+)\s+(\S+)\s*$', line.strip())
-    if not m:
-        return None
-    val_str, event = m.group(1), m.group(2)
-    return event.strip(), int(val_str)
+    import pandas as pd  # type: ignore[import-not-found]
+
+    scanned = _scan_results(results_dir, TRACY_CSV_GLOB, _parse_tracy_name)
+    frames = [df for df in _map_files(lambda entry: _try_read_tracy_csv(entry[1], *entry[0]), scanned)
+              if df is not None]
+    if not frames:
+        return pd.DataFrame(columns=['queue_size', 'producer_count', *TRACY_CSV_COLUMNS])
+    combined = pd.concat(frames, ignore_index=True)
+    return combined.astype({k: 'int64' for k in TRACY_INT_COLUMNS})
 
 
-def _event_matches_metric(event_name: str, metric_key: str) -> bool:
-    """Check if perf event name matches our metric (handles suffixes like :u)."""
-    base_event = event_name.split(':')[0] if ':' in event_name else event_name
-    expected = PERF_METRICS.get(metric_key, metric_key)
-    return base_event == expected
+def _parse_perf_name(path: Path) -> tuple[int, int] | None:
+    """(queue_size, producer_count) for perf_q<N>_p<P>.txt, or None if the name does not match."""
+    m = _PERF_RE.search(path.name)
+    if not m:
+        return None
+    return int(m[1]), int(m[2])
 
 
-def load_all_perf_results(results_dir: Path) -> list[dict[str, Any]]:
+def load_all_perf_results(
+    results_dir: Path,
+    bench_index: dict[tuple[int, int], tuple[int, int]] | None = None,
+) -> list[dict[str, Any]]:
     """
     Load all perf_q<N>_p<P>.txt files from results_dir.
-    Queue size and producer count are read from the corresponding benchmark_results_q<N>_p<P>.json.
+    Queue size and producer count are read from the corresponding benchmark_results_q<N>_p<P>.json,
+    or from bench_index (as returned by load_all_benchmark_results) when given, to avoid re-parsing it.
     Returns list of dicts with queue_size, producer_count, and metric values.
     """
-    paths = sorted(results_dir.glob(PERF_TXT_GLOB), key=_perf_sort_key)
     rows: list[dict[str, Any]] = []
-    for p in paths:
-        m = re.search(r'perf_q(\d+)_p(\d+)\.txt', p.name)
-        if not m:
-            continue
-        q_param, p_param = m.group(1), m.group(2)
+    scanned = _scan_results(results_dir, PERF_TXT_GLOB, _parse_perf_name)
+    texts = _map_files(lambda entry: entry[1].read_text(encoding='utf-8'), scanned)
+    for ((q_param, p_param), _), text in zip(scanned, texts):
+        queue_size = q_param
+        producer_count = p_param
         json_path = results_dir / f'benchmark_results_q{q_param}_p{p_param}.json'
-        queue_size = int(q_param)
-        producer_count = int(p_param)
-        if json_path.exists():
+        if bench_index is not None:
+            queue_size, producer_count = bench_index.get((q_param, p_param), (queue_size, producer_count))
+        elif json_path.exists():
             try:
                 payload = load_benchmark_json(json_path)
-                br = payload.get('benchmarkResults')
-                if isinstance(br, dict):
-                    queue_size = br.get('queueSize', queue_size)
-                    producer_count = br.get('producerCount', producer_count)
-                elif isinstance(br, list) and br:
-                    queue_size = br[0].get('queueSize', queue_size)
-                    producer_count = br[0].get('producerCount', producer_count)
+                results = benchmark_results(payload)
+                if results:
+                    queue_size = results[0].get('queueSize', queue_size)
+                    producer_count = results[0].get('producerCount', producer_count)
             except (json.JSONDecodeError, KeyError) as e:
                 logging.warning("Could not read queue size from %s: %s", json_path.name, e)
         metrics: dict[str, int] = {k: 0 for k in PERF_METRICS}
-        with open(p, 'r', encoding='utf-8') as f:
-            for line in f:
-                parsed = _parse_perf_counter_line(line)
-                if not parsed:
-                    continue
-                event_name, value = parsed
-                for key in PERF_METRICS:
-                    if _event_matches_metric(event_name, key):
-                        metrics[key] = value
-                        break
+        for m in _PERF_METRIC_RE.finditer(text):
+            metrics[_EVENT_TO_KEY[m[2]]] = int(m[1])
         rows.append({
             'queue_size': queue_size,
             'producer_count': producer_count,
@@ -218,36 +285,35 @@ def load_all_perf_results(results_dir: Path) -> list[dict[str, Any]]:
     return rows
 
 
-def organize_data(results):
-    """Organize data by queue size and producer count."""
-    by_queue_size = defaultdict(list)
-    by_producer_count = defaultdict(list)
-    
-    for result in results:
-        queue_size = result['queueSize']
-        producer_count = result['producerCount']
-        # All measurements are taken within 1 second, so successfulPops is ops/sec.
-        # Convert to MOps/sec for nicer plots / consistency.
-        throughput = result['successfulPops'] / 0.5e6 # 0.5 seconds is the duration of the benchmark
-        
-        by_queue_size[queue_size].append({
-            'producerCount': producer_count,
-            'throughput': throughput
-        })
-        
-        by_producer_count[producer_count].append({
-            'queueSize': queue_size,
-            'throughput': throughput
-        })
-    
-    # Sort and organize
-    for queue_size in by_queue_size:
-        by_queue_size[queue_size].sort(key=lambda x: x['producerCount'])
-    
-    for producer_count in by_producer_count:
-        by_producer_count[producer_count].sort(key=lambda x: x['queueSize'])
-    
-    return by_queue_size, by_producer_count
+def organize_data(results) -> tuple[pd.DataFrame, tuple[int, ...], tuple[int, ...]]:
+    """
+    Organize data into one columnar table: queueSize, producerCount, throughput (MOps/sec).
+    Returns (table, sorted unique queue sizes, sorted unique producer counts); the plot functions
+    pivot the table by queue size / producer count and share the precomputed axes.
+    """
+    import pandas as pd  # type: ignore[import-not-found]
+
+    n = len(results)
+    # Narrow the integer axes (queue sizes fit in int32, producer counts in int16) to shrink what
+    # Plotly serializes; throughput stays float64 so the 4-decimal hover/cell labels remain exact.
+    queue_size = np.fromiter((r['queueSize'] for r in results), dtype=np.int32, count=n)
+    producer_count = np.fromiter((r['producerCount'] for r in results), dtype=np.int16, count=n)
+    # Convert successfulPops to MOps/sec for nicer plots / consistency.
+    successful_pops = np.fromiter((r['successfulPops'] for r in results), dtype=np.float64, count=n)
+    throughput = successful_pops * _MOPS_SCALE
+    # One stable C-level sort by (queue size, producer count); ties keep their input order.
+    order = np.lexsort((producer_count, queue_size))
+    df = pd.DataFrame({
+        'queueSize': queue_size[order],
+        'producerCount': producer_count[order],
+        'throughput': throughput[order],
+    })
+    queue_sizes = tuple(np.unique(queue_size).tolist())
+    producer_counts = tuple(np.unique(producer_count).tolist())
+    return df, queue_sizes, producer_counts
+
+
+_BYTE_UNITS = ('B', 'KiB', 'MiB', 'GiB')
 
 
 def _format_bytes(n: Any) -> str:
@@ -255,11 +321,11 @@ def _format_bytes(n: Any) -> str:
         value = int(n)
     except Exception:
         return str(n)
-    if value < 1024:
+    # Pick the unit from the bit length: every 10 bits is the next binary prefix.
+    shift = min((value.bit_length() - 1) // 10, len(_BYTE_UNITS) - 1) if value else 0
+    if shift == 0:
         return f"{value} B"
-    if value < 1024 * 1024:
-        return f"{value / 1024:.1f} KiB"
-    return f"{value / (1024 * 1024):.1f} MiB"
+    return f"{value / (1 << (shift * 10)):.1f} {_BYTE_UNITS[shift]}"
 
 
 def _format_cache(cache: Any) -> str:
@@ -277,11 +343,39 @@ def _format_cache(cache: Any) -> str:
     return f"{size}{extra_str}"
 
 
+@functools.lru_cache(maxsize=None)
+def _plot_template() -> Any:
+    """
+    The plotly_white template object shared by every figure. Figures are built with _validate=False
+    (their properties are literals here), and unvalidated layouts would keep a template *name* unresolved.
+    """
+    import plotly.io as pio  # type: ignore[import-not-found]
+
+    return pio.templates['plotly_white']
+
+
+@functools.lru_cache(maxsize=16)
+def _sample_colors(colorscale: str, n: int) -> tuple[str, ...]:
+    """n colours spread evenly across a named Plotly colorscale (one per line of a plot)."""
+    from plotly.colors import sample_colorscale  # type: ignore[import-not-found]
+
+    if n <= 1:
+        return tuple(sample_colorscale(colorscale, [0.0]))
+    return tuple(sample_colorscale(colorscale, np.linspace(0.0, 1.0, n).tolist()))
+
+
+def _int_labels(values: Any) -> list[str]:
+    """Decimal tick/axis labels for a sequence of ints, formatted in one np.char.mod pass."""
+    return np.char.mod('%d', np.asarray(values, dtype=np.int64)).tolist()
+
+
+@functools.lru_cache(maxsize=None)
 def _queue_size_kb(queue_size: Any) -> float:
     # Use decimal kilobytes for queue size labels.
     return float(queue_size) / 1024.0
 
 
+@functools.lru_cache(maxsize=None)
 def _queue_size_kb_label(queue_size: Any) -> str:
     kb = _queue_size_kb(queue_size)
     if kb.is_integer():
@@ -289,6 +383,36 @@ def _queue_size_kb_label(queue_size: Any) -> str:
     return f"{kb:.2f}"
 
 
+# Text-content escaping for <td>/<pre> bodies (quotes are harmless there)
+_HTML_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+
+_CPUINFO_TEMPLATE = string.Template("""
+      <section class="cpuinfo">
+        <h2>CPU Info</h2>
+        <table class="kv">
+          <tbody>
+            ${table_rows}
+          </tbody>
+        </table>
+        <details>
+          <summary>Raw cpuInfo JSON</summary>
+          <pre class="code">${raw_json}</pre>
+        </details>
+      </section>
+    """)
+
+
+def _dump_json_pretty(value: Any) -> str:
+    """json.dumps(value, indent=2, sort_keys=True), done by orjson when available."""
+    if _json_fast is not None:
+        try:
+            return _json_fast.dumps(value, option=_json_fast.OPT_INDENT_2 | _json_fast.OPT_SORT_KEYS).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib encoder handles them
+    return json.dumps(value, indent=2, sort_keys=True)
+
+
 def _render_cpuinfo_html(cpu_info: Any) -> str:
     if not isinstance(cpu_info, dict) or not cpu_info:
         return ""
@@ -298,274 +422,345 @@ def _render_cpuinfo_html(cpu_info: Any) -> str:
     cores = cpu_info.get("coresPerSocket")
     page_size = cpu_info.get("pageSize")
 
+    # (label, value) with values already HTML-safe. Labels are literals; only free-form strings
+    # (vendor / uarch, or anything that is not a plain int) need escaping.
     rows: list[tuple[str, str]] = []
     if vendor is not None:
-        rows.append(("Vendor", str(vendor)))
+        rows.append(("Vendor", html_escape(str(vendor))))
     if uarch is not None:
-        rows.append(("Microarchitecture", str(uarch)))
+        rows.append(("Microarchitecture", html_escape(str(uarch))))
     if cores is not None:
-        rows.append(("Cores per socket", str(cores)))
+        rows.append(("Cores per socket", str(cores) if isinstance(cores, int) else html_escape(str(cores))))
     if page_size is not None:
-        rows.append(("Page size", _format_bytes(page_size)))
+        page_size_str = _format_bytes(page_size)
+        rows.append(("Page size", page_size_str if isinstance(page_size, int) else html_escape(page_size_str)))
 
     # Cache details (if present)
-    if "l1iCache" in cpu_info:
-        rows.append(("L1I cache", _format_cache(cpu_info.get("l1iCache"))))
-    if "l1dCache" in cpu_info:
-        rows.append(("L1D cache", _format_cache(cpu_info.get("l1dCache"))))
-    if "l2Cache" in cpu_info:
-        rows.append(("L2 cache", _format_cache(cpu_info.get("l2Cache"))))
-    if "l3Cache" in cpu_info:
-        rows.append(("L3 cache", _format_cache(cpu_info.get("l3Cache"))))
-
-    table_rows = "\n".join(
-        f"<tr><th>{html_escape(k)}</th><td>{html_escape(v)}</td></tr>" for k, v in rows
-    )
-    raw_json = html_escape(json.dumps(cpu_info, indent=2, sort_keys=True))
+    for key, label in (("l1iCache", "L1I cache"), ("l1dCache", "L1D cache"),
+                       ("l2Cache", "L2 cache"), ("l3Cache", "L3 cache")):
+        if key in cpu_info:
+            rows.append((label, _format_cache(cpu_info.get(key)).translate(_HTML_ESCAPE_TABLE)))
 
-    return f"""
-      <section class="cpuinfo">
-        <h2>CPU Info</h2>
-        <table class="kv">
-          <tbody>
-            {table_rows}
-          </tbody>
-        </table>
-        <details>
-          <summary>Raw cpuInfo JSON</summary>
-          <pre class="code">{raw_json}</pre>
-        </details>
-      </section>
-    """
+    table_rows = "\n".join(f"<tr><th>{k}</th><td>{v}</td></tr>" for k, v in rows)
+    raw_json = _dump_json_pretty(cpu_info).translate(_HTML_ESCAPE_TABLE)
 
+    return _CPUINFO_TEMPLATE.substitute(table_rows=table_rows, raw_json=raw_json)
 
-def write_html_report(figures: List[go.Figure], output_path: Path, cpu_info: Any = None) -> None:
-    """Write a single HTML report containing multiple Plotly figures."""
-    parts: List[str] = []
-    for i, fig in enumerate(figures):
-        parts.append(
-            pio.to_html(
-                fig,
-                include_plotlyjs=("cdn" if i == 0 else False),  # type: ignore[arg-type]
-                full_html=False,
-            )
-        )
 
-    figures_html = "\n".join(f'<div class="figure">{p}</div>' for p in parts)
-    cpu_html = _render_cpuinfo_html(cpu_info)
+# plotly.js is loaded once in the page head from a copy of the installed plotly.py bundle written next
+# to the report, so viewing it needs no network; figures are emitted without it.
+_PLOTLY_JS_NAME = "plotly.min.js"
 
-    html = f"""<!doctype html>
+_HTML_HEAD = """<!doctype html>
 <html lang="en">
   <head>
     <meta charset="utf-8" />
     <meta name="viewport" content="width=device-width, initial-scale=1" />
     <title>Benchmark Visualizations</title>
+    <script charset="utf-8" src="PLOTLY_JS_NAME"></script>
     <style>
-      body {{ font-family: system-ui, -apple-system, Segoe UI, Roboto, sans-serif; margin: 20px; }}
-      .container {{ max-width: 1200px; margin: 0 auto; }}
-      .figures {{ display: flex; flex-direction: column; gap: 48px; }}
-      .figure {{ margin: 0; }}
-      h2 {{ margin: 1.25rem 0 0.75rem; }}
-      .cpuinfo {{ margin: 1rem 0 1.75rem; padding: 16px; border: 1px solid #e6e6e6; border-radius: 10px; background: #fafafa; }}
-      table.kv {{ border-collapse: collapse; width: 100%; }}
-      table.kv th {{ text-align: left; font-weight: 600; color: #333; padding: 8px 10px; width: 220px; vertical-align: top; }}
-      table.kv td {{ padding: 8px 10px; color: #111; }}
-      table.kv tr + tr th, table.kv tr + tr td {{ border-top: 1px solid #ededed; }}
-      details {{ margin-top: 12px; }}
-      details summary {{ cursor: pointer; color: #333; }}
-      pre.code {{ margin: 10px 0 0; padding: 12px; background: #fff; border: 1px solid #eee; border-radius: 8px; overflow: auto; }}
+      body { font-family: system-ui, -apple-system, Segoe UI, Roboto, sans-serif; margin: 20px; }
+      .container { max-width: 1200px; margin: 0 auto; }
+      .figures { display: flex; flex-direction: column; gap: 48px; }
+      .figure { margin: 0; }
+      h2 { margin: 1.25rem 0 0.75rem; }
+      .cpuinfo { margin: 1rem 0 1.75rem; padding: 16px; border: 1px solid #e6e6e6; border-radius: 10px; background: #fafafa; }
+      table.kv { border-collapse: collapse; width: 100%; }
+      table.kv th { text-align: left; font-weight: 600; color: #333; padding: 8px 10px; width: 220px; vertical-align: top; }
+      table.kv td { padding: 8px 10px; color: #111; }
+      table.kv tr + tr th, table.kv tr + tr td { border-top: 1px solid #ededed; }
+      details { margin-top: 12px; }
+      details summary { cursor: pointer; color: #333; }
+      pre.code { margin: 10px 0 0; padding: 12px; background: #fff; border: 1px solid #eee; border-radius: 8px; overflow: auto; }
     </style>
   </head>
   <body>
     <div class="container">
       <h1>Benchmark Visualizations</h1>
-      {cpu_html}
+""".replace("PLOTLY_JS_NAME", _PLOTLY_JS_NAME).encode('utf-8')
+
+_HTML_FIGURES_OPEN = b"""
       <div class="figures">
-        {figures_html}
-      </div>
+"""
+
+_HTML_FIGURES_CLOSE = b"""      </div>
     </div>
-  </body>
+"""
+
+_HTML_TAIL = b"""  </body>
 </html>
 """
 
-    output_path.write_text(html, encoding="utf-8")
+# Passed to every Plotly.newPlot call in the report
+_PLOTLY_CONFIG_JSON = json.dumps({'responsive': False})
+# Merged over every figure's layout in the browser: the report is static, so relayouts (legend toggles,
+# zoom) apply immediately instead of animating. The heatmap stays interactive for its hover values.
+_PLOTLY_LAYOUT_OVERRIDES_JSON = json.dumps({'transition': {'duration': 0}})
+# Figure JSON encoder: orjson encodes numpy arrays in C; plotly's stdlib encoder is the fallback
+_PLOTLY_JSON_ENGINE = 'orjson' if _json_fast is not None else 'json'
+
+_HTML_SCRIPT_OPEN = b'    <script>\n      const figures = [\n'
+_HTML_SCRIPT_CLOSE = (
+    '      ];\n'
+    '      figures.forEach((fig, i) => Plotly.newPlot('
+    f'`figure-${{i}}`, fig.data, {{...fig.layout, ...{_PLOTLY_LAYOUT_OVERRIDES_JSON}}}, {_PLOTLY_CONFIG_JSON}));\n'
+    '    </script>\n'
+).encode('utf-8')
+
+
+def _copy_plotlyjs(output_dir: Path) -> None:
+    """Write the plotly.js bundle shipped with plotly.py into output_dir, unless an identical copy is there."""
+    from plotly.offline import get_plotlyjs  # type: ignore[import-not-found]
+
+    bundle = get_plotlyjs().encode('utf-8')
+    target = output_dir / _PLOTLY_JS_NAME
+    try:
+        if target.stat().st_size == len(bundle) and target.read_bytes() == bundle:
+            return
+    except OSError:
+        pass
+    target.write_bytes(bundle)
+    logging.info(f"Saved: {target}")
+
+
+def write_html_report(figures: List[go.Figure], output_path: Path, cpu_info: Any = None) -> None:
+    """
+    Write a single HTML report containing multiple Plotly figures, streaming each figure to disk.
+    Each figure gets an empty <div>; one script at the end serializes every figure's JSON once and
+    renders it with Plotly.newPlot, instead of a full pio.to_html scaffold per figure.
+    plotly.min.js is copied next to output_path for the page to load.
+    """
+    import plotly.io as pio  # type: ignore[import-not-found]
+
+    _copy_plotlyjs(output_path.parent)
+    # Everything is written as pre-encoded UTF-8 bytes: the static parts are encoded once at import
+    with output_path.open('wb') as fh:
+        fh.write(_HTML_HEAD)
+        fh.write(_render_cpuinfo_html(cpu_info).encode('utf-8'))
+        fh.write(_HTML_FIGURES_OPEN)
+        fh.write(''.join(f'<div class="figure" id="figure-{i}"></div>\n' for i in range(len(figures))).encode('utf-8'))
+        fh.write(_HTML_FIGURES_CLOSE)
+
+        fh.write(_HTML_SCRIPT_OPEN)
+        for fig in figures:
+            # pio.to_json escapes '<', '>' and '/' so the payload is safe inside <script> (with either engine).
+            # The figures were validated when they were built, so skip re-validating them here.
+            fh.write(pio.to_json(fig, validate=False, engine=_PLOTLY_JSON_ENGINE).encode('utf-8'))
+            fh.write(b',\n')
+        fh.write(_HTML_SCRIPT_CLOSE)
+        fh.write(_HTML_TAIL)
+
     logging.info(f"Saved: {output_path}")
 
 
-def plot_queue_size_effect(by_queue_size) -> go.Figure:
-    """Plot throughput vs queue size for different producer counts."""
-    fig = go.Figure()
-
-    # Get unique producer counts and sort them
-    all_producer_counts = set()
-    for data_list in by_queue_size.values():
-        for entry in data_list:
-            all_producer_counts.add(entry['producerCount'])
-    producer_counts = sorted(all_producer_counts)
-    
-    # Plot a line for each producer count
-    colors = px.colors.sequential.Viridis
-    
-    for i, producer_count in enumerate(producer_counts):
-        queue_sizes = []
-        throughputs = []
-        
-        for queue_size in sorted(by_queue_size.keys()):
-            # Find matching entry
-            for entry in by_queue_size[queue_size]:
-                if entry['producerCount'] == producer_count:
-                    queue_sizes.append(_queue_size_kb(queue_size))
-                    throughputs.append(entry['throughput'])
-                    break
-        
-        if queue_sizes:
-            fig.add_trace(
-                go.Scatter(
-                    x=queue_sizes,
-                    y=throughputs,
-                    mode="lines+markers",
-                    name=f"{producer_count} producer(s)",
-                    line={"width": 2, "color": colors[i % len(colors)]},
-                    marker={"size": 9, "symbol": "circle"},
-                )
-            )
-
-    tick_vals = [_queue_size_kb(qs) for qs in sorted(by_queue_size.keys())]
-    tick_text = [_queue_size_kb_label(qs) for qs in sorted(by_queue_size.keys())]
-
-    fig.update_layout(
-        template="plotly_white",
-        width=1100,
-        height=750,
-        title="Effect of Queue Size on Throughput<br>(by Producer Count)",
-        legend_title_text="Producer Count",
-        margin=dict(l=80, r=40, t=90, b=120),
-    )
-    fig.update_xaxes(
-        title_text="Queue Size (kB)",
-        type="log",
-        tickmode="array",
-        tickvals=tick_vals,
-        ticktext=tick_text,
-        tickangle=-45,
-    )
-    fig.update_yaxes(title_text="Throughput (MOps/sec)", rangemode="tozero")
+def _throughput_groups(df: pd.DataFrame, by: str) -> tuple[pd.DataFrame, Any]:
+    """
+    (deduplicated table, its groupby on `by` in ascending order), first result per combination only.
+    The table is sorted by (queueSize, producerCount), so each group is already ordered along the other axis.
+    """
+    unique = df.drop_duplicates(['queueSize', 'producerCount'], keep='first')
+    return unique, unique.groupby(by, sort=True)
 
-    return fig
 
+def _scatter_type(total_points: int) -> Any:
+    """go.Scattergl for plots with more than _SCATTERGL_MIN_POINTS points, go.Scatter otherwise."""
+    import plotly.graph_objects as go  # type: ignore[import-not-found]
 
-def plot_producer_count_effect(by_producer_count) -> go.Figure:
-    """Plot throughput vs producer count for different queue sizes."""
-    fig = go.Figure()
-
-    # Get unique queue sizes and sort them
-    all_queue_sizes = set()
-    for data_list in by_producer_count.values():
-        for entry in data_list:
-            all_queue_sizes.add(entry['queueSize'])
-    queue_sizes = sorted(all_queue_sizes)
-    
-    # Plot a line for each queue size
-    colors = px.colors.sequential.Plasma
-    
-    for i, queue_size in enumerate(queue_sizes):
-        producer_counts = []
-        throughputs = []
-        
-        for producer_count in sorted(by_producer_count.keys()):
-            # Find matching entry
-            for entry in by_producer_count[producer_count]:
-                if entry['queueSize'] == queue_size:
-                    producer_counts.append(producer_count)
-                    throughputs.append(entry['throughput'])
-                    break
-        
-        if producer_counts:
-            fig.add_trace(
-                go.Scatter(
-                    x=producer_counts,
-                    y=throughputs,
-                    mode="lines+markers",
-                    name=f"Queue size: {_queue_size_kb_label(queue_size)} kB",
-                    line={"width": 2, "color": colors[i % len(colors)]},
-                    marker={"size": 9, "symbol": "square"},
-                )
-            )
-
-    tick_vals = sorted(by_producer_count.keys())
-    tick_text = [str(pc) for pc in tick_vals]
-
-    fig.update_layout(
-        template="plotly_white",
-        width=1100,
-        height=750,
-        title="Effect of Producer Count on Throughput<br>(by Queue Size)",
-        legend_title_text="Queue Size",
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="left", x=0),
-        margin=dict(l=80, r=40, t=200, b=80),
-    )
-    fig.update_xaxes(
-        title_text="Producer Count",
-        type="log",
-        tickmode="array",
-        tickvals=tick_vals,
-        ticktext=tick_text,
-    )
-    fig.update_yaxes(title_text="Throughput (MOps/sec)", rangemode="tozero")
+    return go.Scattergl if total_points > _SCATTERGL_MIN_POINTS else go.Scatter
 
-    return fig
 
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Indices of the n_out points picked by largest-triangle-three-buckets downsampling of (x, y), x sorted.
+    Keeps the first and last point and, from each bucket in between, the point forming the largest triangle
+    with the previously kept point and the mean of the next bucket, which preserves peaks and the line's shape.
+    """
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    x = x.astype(np.float64)
+    y = y.astype(np.float64)
+    # n_out - 2 buckets over the interior points; every bucket holds at least one point since n > n_out
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    picked = np.empty(n_out, dtype=np.int64)
+    picked[0], picked[-1] = 0, n - 1
+    a = 0
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        if b + 2 < len(edges):
+            next_x, next_y = x[hi:edges[b + 2]].mean(), y[hi:edges[b + 2]].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+        area = np.abs((x[a] - next_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (next_y - y[a]))
+        a = lo + int(np.argmax(area))
+        picked[b + 1] = a
+    return picked
+
+
+def _line_points(x: np.ndarray, y: np.ndarray) -> dict[str, np.ndarray]:
+    """
+    {'x': ..., 'y': ...} for a line trace on a log x-axis, decimated to _LINE_MAX_POINTS when longer.
+    Triangle areas are measured on log2(x) so the kept points follow what the log axis shows.
+    """
+    if len(x) <= _LINE_MAX_POINTS:
+        return {'x': x, 'y': y}
+    x_plot = np.log2(x) if bool((x > 0).all()) else x
+    keep = _lttb_indices(x_plot, y, _LINE_MAX_POINTS)
+    return {'x': x[keep], 'y': y[keep]}
 
-def plot_heatmap(results) -> go.Figure:
-    """Create a heatmap showing throughput for all combinations."""
-    # Organize data into a 2D grid
-    queue_sizes = sorted(set(r['queueSize'] for r in results))
-    producer_counts = sorted(set(r['producerCount'] for r in results))
-    
-    # Create matrix (rows: producerCounts, cols: queueSizes)
-    throughput_matrix = [[0.0 for _ in queue_sizes] for _ in producer_counts]
-    qs_idx_map = {qs: i for i, qs in enumerate(queue_sizes)}
-    pc_idx_map = {pc: i for i, pc in enumerate(producer_counts)}
-
-    for result in results:
-        qs_idx = qs_idx_map[result['queueSize']]
-        pc_idx = pc_idx_map[result['producerCount']]
-        throughput_matrix[pc_idx][qs_idx] = result['successfulPops'] / 0.5e6
-
-    text = [[f"{v:.4f}" for v in row] for row in throughput_matrix]
-
-    fig = go.Figure(
-        data=go.Heatmap(
-            z=throughput_matrix,
-            x=[_queue_size_kb_label(qs) for qs in queue_sizes],
-            y=[str(pc) for pc in producer_counts],
-            colorscale="YlOrRd",
-            colorbar={"title": "Throughput (MOps/sec)"},
-            text=text,
-            texttemplate="%{text}",
-            textfont={"size": 10, "color": "black"},
-            hovertemplate="Producer Count=%{y}<br>Queue Size=%{x} kB<br>Throughput=%{z:.4f} MOps/sec<extra></extra>",
-        )
-    )
 
-    fig.update_layout(
-        template="plotly_white",
-        width=1200,
-        height=850,
-        title="Throughput Heatmap<br>(MOps/sec measured in 1 second)",
-        margin=dict(l=90, r=40, t=90, b=80),
-    )
-    fig.update_xaxes(title_text="Queue Size (kB)")
-    fig.update_yaxes(title_text="Producer Count")
+def _line_traces(scatter: Any, points: dict[str, np.ndarray], name: str,
+                 line: dict[str, Any], marker: dict[str, Any]) -> list[Any]:
+    """
+    Traces for one plotted line: a single "lines+markers" trace, or for lines longer than
+    _MARKERS_MAX_POINTS a "lines" trace plus an unlisted "markers" trace over every
+    _SPARSE_MARKER_STEP-th point, in one legend group so the legend toggles both.
+    line must carry its colour so the two traces match.
+    """
+    if len(points['x']) <= _MARKERS_MAX_POINTS:
+        return [scatter(**points, mode="lines+markers", name=name, line=line, marker=marker, _validate=False)]
+    sparse = {k: v[::_SPARSE_MARKER_STEP] for k, v in points.items()}
+    return [
+        scatter(**points, mode="lines", name=name, legendgroup=name, line=line, _validate=False),
+        scatter(
+            **sparse,
+            mode="markers",
+            name=name,
+            legendgroup=name,
+            showlegend=False,
+            hoverinfo="skip",
+            marker={**marker, "color": line["color"]},
+            _validate=False,
+        ),
+    ]
+
 
-    return fig
+def plot_queue_size_effect(df: pd.DataFrame, queue_sizes: tuple[int, ...]) -> go.Figure:
+    """Plot throughput vs queue size for different producer counts."""
+    import plotly.graph_objects as go  # type: ignore[import-not-found]
+
+    # One group per producer count, each ordered by queue size; first entry wins on duplicates
+    unique, groups = _throughput_groups(df, 'producerCount')
+    qs_kb = [_queue_size_kb(qs) for qs in queue_sizes]
+    qs_labels = [_queue_size_kb_label(qs) for qs in queue_sizes]
+
+    # One line per producer count, all handed to the Figure constructor at once
+    colors = _sample_colors('Viridis', groups.ngroups)
+    scatter = _scatter_type(len(unique))
+    traces = [
+        trace
+        for i, (producer_count, group) in enumerate(groups)
+        for trace in _line_traces(
+            scatter,
+            # Same decimal-kB conversion as _queue_size_kb, done on the whole column
+            _line_points(group['queueSize'].to_numpy() / 1024.0, group['throughput'].to_numpy()),
+            name=f"{producer_count} producer(s)",
+            line={"width": 2, "color": colors[i % len(colors)]},
+            marker={"size": 9, "symbol": "circle"},
+        )
+    ]
 
+    layout = {
+        "template": _plot_template(),
+        "width": 1100,
+        "height": 750,
+        "title": {"text": "Effect of Queue Size on Throughput<br>(by Producer Count)"},
+        "legend": {"title": {"text": "Producer Count"}},
+        "margin": {"l": 80, "r": 40, "t": 90, "b": 120},
+        "xaxis": {
+            "title": {"text": "Queue Size (kB)"},
+            "type": "log",
+            "tickmode": "array",
+            "tickvals": qs_kb,
+            "ticktext": qs_labels,
+            "tickangle": -45,
+        },
+        "yaxis": {"title": {"text": "Throughput (MOps/sec)"}, "rangemode": "tozero"},
+    }
+    return go.Figure(data=traces, layout=layout, _validate=False)
+
+
+def plot_producer_count_effect(df: pd.DataFrame, producer_counts: tuple[int, ...]) -> go.Figure:
+    """Plot throughput vs producer count for different queue sizes."""
+    import plotly.graph_objects as go  # type: ignore[import-not-found]
+
+    # One group per queue size, each ordered by producer count; first entry wins on duplicates
+    unique, groups = _throughput_groups(df, 'queueSize')
+
+    # One line per queue size, all handed to the Figure constructor at once
+    colors = _sample_colors('Plasma', groups.ngroups)
+    scatter = _scatter_type(len(unique))
+    traces = [
+        trace
+        for i, (queue_size, group) in enumerate(groups)
+        for trace in _line_traces(
+            scatter,
+            _line_points(group['producerCount'].to_numpy(), group['throughput'].to_numpy()),
+            name=f"Queue size: {_queue_size_kb_label(int(queue_size))} kB",
+            line={"width": 2, "color": colors[i % len(colors)]},
+            marker={"size": 9, "symbol": "square"},
+        )
+    ]
 
-def _tracy_series_key(r: dict[str, Any]) -> tuple[str, int]:
-    """(zone name, producer_count) for grouping Tracy traces per producer."""
-    name = r.get('name') or 'unknown'
-    pc = r.get('producer_count', 0)
-    return name, pc
+    layout = {
+        "template": _plot_template(),
+        "width": 1100,
+        "height": 750,
+        "title": {"text": "Effect of Producer Count on Throughput<br>(by Queue Size)"},
+        "legend": {
+            "title": {"text": "Queue Size"},
+            "orientation": "h", "yanchor": "bottom", "y": 1.02, "xanchor": "left", "x": 0,
+        },
+        "margin": {"l": 80, "r": 40, "t": 200, "b": 80},
+        "xaxis": {
+            "title": {"text": "Producer Count"},
+            "type": "log",
+            "tickmode": "array",
+            "tickvals": list(producer_counts),
+            "ticktext": _int_labels(producer_counts),
+        },
+        "yaxis": {"title": {"text": "Throughput (MOps/sec)"}, "rangemode": "tozero"},
+    }
+    return go.Figure(data=traces, layout=layout, _validate=False)
+
+
+def plot_heatmap(df: pd.DataFrame, queue_sizes: tuple[int, ...], producer_counts: tuple[int, ...]) -> go.Figure:
+    """Create a heatmap showing throughput for all combinations."""
+    import plotly.graph_objects as go  # type: ignore[import-not-found]
+    from plotly.colors import get_colorscale  # type: ignore[import-not-found]
+
+    # Organize data into a 2D grid (rows: producerCounts, cols: queueSizes); missing cells stay 0.
+    qs_idx = np.searchsorted(queue_sizes, df['queueSize'].to_numpy())
+    pc_idx = np.searchsorted(producer_counts, df['producerCount'].to_numpy())
+    throughput_matrix = np.zeros((len(producer_counts), len(queue_sizes)), dtype=np.float64)
+    # Fancy-index assignment: the last result wins for duplicate combinations
+    throughput_matrix[pc_idx, qs_idx] = df['throughput'].to_numpy()
+    # Cell labels are formatted by plotly.js from z, so no string matrix is shipped alongside it
+    text_args: dict[str, Any] = {}
+    if throughput_matrix.size <= _HEATMAP_TEXT_MAX_CELLS:
+        text_args = {'texttemplate': "%{z:.4f}", 'textfont': {"size": 10, "color": "black"}}
+
+    heatmap = go.Heatmap(
+        z=throughput_matrix,
+        x=[_queue_size_kb_label(qs) for qs in queue_sizes],
+        y=_int_labels(producer_counts),
+        # Resolved here since the unvalidated trace would otherwise ship the bare name to plotly.js
+        colorscale=get_colorscale("YlOrRd"),
+        colorbar={"title": {"text": "Throughput (MOps/sec)"}},
+        hovertemplate="Producer Count=%{y}<br>Queue Size=%{x} kB<br>Throughput=%{z:.4f} MOps/sec<extra></extra>",
+        _validate=False,
+        **text_args,
+    )
+    layout = {
+        "template": _plot_template(),
+        "width": 1200,
+        "height": 850,
+        "title": {"text": "Throughput Heatmap<br>(MOps/sec measured in 1 second)"},
+        "margin": {"l": 90, "r": 40, "t": 90, "b": 80},
+        "xaxis": {"title": {"text": "Queue Size (kB)"}},
+        "yaxis": {"title": {"text": "Producer Count"}},
+    }
+    return go.Figure(data=heatmap, layout=layout, _validate=False)
 
 
 def _tracy_legend_label(name: str, producer_count: int) -> str:
@@ -575,161 +770,117 @@ def _tracy_legend_label(name: str, producer_count: int) -> str:
     return f"{name} ({producer_count} producer{'s' if producer_count != 1 else ''})"
 
 
-def plot_tracy_push_mean_ns(tracy_rows: list[dict[str, Any]]) -> go.Figure:
-    """Plot Push mean latency (mean_ns) vs queue size, one line per producer count (Push zone only)."""
-    push_rows = [r for r in tracy_rows if 'Push' in (r.get('name') or '')]
-    fig = go.Figure()
-    by_series: dict[tuple[str, int], list[tuple[int, float]]] = defaultdict(list)
-    for r in push_rows:
-        key = _tracy_series_key(r)
-        qs = r.get('queue_size', 0)
-        by_series[key].append((qs, r.get('mean_ns', 0)))
-    for (name, pc), pts in sorted(by_series.items(), key=lambda x: (x[0][0], x[0][1])):
-        pts = sorted(pts, key=lambda x: x[0])
-        queue_sizes = [x[0] for x in pts]
-        mean_ns = [x[1] for x in pts]
-        label = _tracy_legend_label(name, pc)
-        fig.add_trace(
-            go.Scatter(
-                x=queue_sizes,
-                y=mean_ns,
-                mode="lines+markers",
-                name=label,
-                line={"width": 2},
-                marker={"size": 8},
-            )
+# (zone name, producer_count) -> (queue_sizes, values), sorted by queue size
+TracySeries = dict[tuple[str, int], tuple[np.ndarray, np.ndarray]]
+
+
+def _group_tracy(tracy: pd.DataFrame, name_filters: tuple[str, ...]) -> dict[str, tuple[TracySeries, TracySeries]]:
+    """
+    Group Tracy rows by (zone name, producer_count) for every zone name filter.
+    A row belongs to each filter contained in its zone name.
+    Returns {name_filter: (by_series_mean_ns, by_series_counts)}.
+    """
+    by_queue_size = tracy.sort_values('queue_size', kind='stable')
+    grouped: dict[str, tuple[TracySeries, TracySeries]] = {}
+    for name_filter in name_filters:
+        mask = by_queue_size['name'].str.contains(name_filter, regex=False).to_numpy(dtype=bool)
+        by_series_mean: TracySeries = {}
+        by_series_counts: TracySeries = {}
+        for (name, pc), g in by_queue_size[mask].groupby(['name', 'producer_count'], sort=True):
+            key = (str(name), int(pc))
+            queue_sizes = g['queue_size'].to_numpy()
+            by_series_mean[key] = (queue_sizes, g['mean_ns'].to_numpy())
+            by_series_counts[key] = (queue_sizes, g['counts'].to_numpy())
+        grouped[name_filter] = (by_series_mean, by_series_counts)
+    return grouped
+
+
+def _plot_tracy_series(by_series: TracySeries, title: str, yaxis_title: str) -> go.Figure:
+    """Create a Tracy multiline plot (queue_size x-axis, one line per zone/producer count)."""
+    import plotly.graph_objects as go  # type: ignore[import-not-found]
+
+    # Explicit colours (the template's colourway, in the order plotly.js would assign it) keep a line's
+    # sparse-marker trace the same colour as the line itself
+    colorway = _plot_template().layout.colorway
+    traces = [
+        trace
+        for i, ((name, pc), (queue_sizes, values)) in enumerate(sorted(by_series.items(), key=lambda x: x[0]))
+        for trace in _line_traces(
+            go.Scatter,
+            _line_points(queue_sizes, values),
+            name=_tracy_legend_label(name, pc),
+            line={"width": 2, "color": colorway[i % len(colorway)]},
+            marker={"size": 8},
         )
-    fig.update_layout(
-        template="plotly_white",
-        width=1100,
-        height=600,
-        title="Tracy: Push mean latency (ns) by producer count vs queue size",
-        legend_title_text="Producers",
-        margin=dict(l=80, r=40, t=80, b=80),
+    ]
+    layout = {
+        "template": _plot_template(),
+        "width": 1100,
+        "height": 600,
+        "title": {"text": title},
+        "legend": {"title": {"text": "Producers"}},
+        "margin": {"l": 80, "r": 40, "t": 80, "b": 80},
+        "xaxis": {"title": {"text": "Queue size"}, "type": "log"},
+        "yaxis": {"title": {"text": yaxis_title}, "rangemode": "tozero"},
+    }
+    return go.Figure(data=traces, layout=layout, _validate=False)
+
+
+def plot_tracy_push_mean_ns(push_mean_ns: TracySeries) -> go.Figure:
+    """Plot Push mean latency (mean_ns) vs queue size, one line per producer count (Push zone only)."""
+    return _plot_tracy_series(
+        push_mean_ns,
+        "Tracy: Push mean latency (ns) by producer count vs queue size",
+        "Mean latency (ns)",
     )
-    fig.update_xaxes(title_text="Queue size", type="log")
-    fig.update_yaxes(title_text="Mean latency (ns)", rangemode="tozero")
-    return fig
 
 
-def plot_tracy_pop_mean_ns(tracy_rows: list[dict[str, Any]]) -> go.Figure:
+def plot_tracy_pop_mean_ns(pop_mean_ns: TracySeries) -> go.Figure:
     """Plot Pop mean latency (mean_ns) vs queue size, one line per producer count (Pop zone only)."""
-    pop_rows = [r for r in tracy_rows if 'Pop' in (r.get('name') or '')]
-    fig = go.Figure()
-    by_series: dict[tuple[str, int], list[tuple[int, float]]] = defaultdict(list)
-    for r in pop_rows:
-        key = _tracy_series_key(r)
-        qs = r.get('queue_size', 0)
-        by_series[key].append((qs, r.get('mean_ns', 0)))
-    for (name, pc), pts in sorted(by_series.items(), key=lambda x: (x[0][0], x[0][1])):
-        pts = sorted(pts, key=lambda x: x[0])
-        queue_sizes = [x[0] for x in pts]
-        mean_ns = [x[1] for x in pts]
-        label = _tracy_legend_label(name, pc)
-        fig.add_trace(
-            go.Scatter(
-                x=queue_sizes,
-                y=mean_ns,
-                mode="lines+markers",
-                name=label,
-                line={"width": 2},
-                marker={"size": 8},
-            )
-        )
-    fig.update_layout(
-        template="plotly_white",
-        width=1100,
-        height=600,
-        title="Tracy: Pop mean latency (ns) by producer count vs queue size",
-        legend_title_text="Producers",
-        margin=dict(l=80, r=40, t=80, b=80),
+    return _plot_tracy_series(
+        pop_mean_ns,
+        "Tracy: Pop mean latency (ns) by producer count vs queue size",
+        "Mean latency (ns)",
     )
-    fig.update_xaxes(title_text="Queue size", type="log")
-    fig.update_yaxes(title_text="Mean latency (ns)", rangemode="tozero")
-    return fig
 
 
-def plot_tracy_push_counts(tracy_rows: list[dict[str, Any]]) -> go.Figure:
+def plot_tracy_push_counts(push_counts: TracySeries) -> go.Figure:
     """Plot Push counts vs queue size, one line per producer count (Push zone only)."""
-    push_rows = [r for r in tracy_rows if 'Push' in (r.get('name') or '')]
-    fig = go.Figure()
-    by_series: dict[tuple[str, int], list[tuple[int, float]]] = defaultdict(list)
-    for r in push_rows:
-        key = _tracy_series_key(r)
-        qs = r.get('queue_size', 0)
-        by_series[key].append((qs, r.get('counts', 0)))
-    for (name, pc), pts in sorted(by_series.items(), key=lambda x: (x[0][0], x[0][1])):
-        pts = sorted(pts, key=lambda x: x[0])
-        queue_sizes = [x[0] for x in pts]
-        counts = [x[1] for x in pts]
-        label = _tracy_legend_label(name, pc)
-        fig.add_trace(
-            go.Scatter(
-                x=queue_sizes,
-                y=counts,
-                mode="lines+markers",
-                name=label,
-                line={"width": 2},
-                marker={"size": 8},
-            )
-        )
-    fig.update_layout(
-        template="plotly_white",
-        width=1100,
-        height=600,
-        title="Tracy: Push counts by producer count vs queue size",
-        legend_title_text="Producers",
-        margin=dict(l=80, r=40, t=80, b=80),
+    return _plot_tracy_series(
+        push_counts,
+        "Tracy: Push counts by producer count vs queue size",
+        "Count",
     )
-    fig.update_xaxes(title_text="Queue size", type="log")
-    fig.update_yaxes(title_text="Count", rangemode="tozero")
-    return fig
 
 
-def plot_tracy_pop_counts(tracy_rows: list[dict[str, Any]]) -> go.Figure:
+def plot_tracy_pop_counts(pop_counts: TracySeries) -> go.Figure:
     """Plot Pop counts vs queue size, one line per producer count (Pop zone only)."""
-    pop_rows = [r for r in tracy_rows if 'Pop' in (r.get('name') or '')]
-    fig = go.Figure()
-    by_series: dict[tuple[str, int], list[tuple[int, float]]] = defaultdict(list)
-    for r in pop_rows:
-        key = _tracy_series_key(r)
-        qs = r.get('queue_size', 0)
-        by_series[key].append((qs, r.get('counts', 0)))
-    for (name, pc), pts in sorted(by_series.items(), key=lambda x: (x[0][0], x[0][1])):
-        pts = sorted(pts, key=lambda x: x[0])
-        queue_sizes = [x[0] for x in pts]
-        counts = [x[1] for x in pts]
-        label = _tracy_legend_label(name, pc)
-        fig.add_trace(
-            go.Scatter(
-                x=queue_sizes,
-                y=counts,
-                mode="lines+markers",
-                name=label,
-                line={"width": 2},
-                marker={"size": 8},
-            )
-        )
-    fig.update_layout(
-        template="plotly_white",
-        width=1100,
-        height=600,
-        title="Tracy: Pop counts by producer count vs queue size",
-        legend_title_text="Producers",
-        margin=dict(l=80, r=40, t=80, b=80),
+    return _plot_tracy_series(
+        pop_counts,
+        "Tracy: Pop counts by producer count vs queue size",
+        "Count",
     )
-    fig.update_xaxes(title_text="Queue size", type="log")
-    fig.update_yaxes(title_text="Count", rangemode="tozero")
-    return fig
+
+
+def _perf_placeholder_figure(message: str, title: str) -> go.Figure:
+    """Empty perf figure with a centred note, for when there is nothing to plot."""
+    import plotly.graph_objects as go  # type: ignore[import-not-found]
+
+    return go.Figure(layout={
+        "template": _plot_template(),
+        "width": 1100,
+        "height": 600,
+        "title": {"text": title},
+        "annotations": [{"text": message, "xref": "paper", "yref": "paper", "x": 0.5, "y": 0.5, "showarrow": False}],
+    }, _validate=False)
 
 
 def _plot_perf_metric_multiline(perf_rows: list[dict[str, Any]], metric_key: str, title: str) -> go.Figure:
     """Create a multiline plot for a single perf metric (queue_size x-axis, one line per producer count)."""
+    import plotly.graph_objects as go  # type: ignore[import-not-found]
+
     if not perf_rows:
-        fig = go.Figure()
-        fig.add_annotation(text="No perf data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
-        fig.update_layout(template="plotly_white", width=1100, height=600, title=title)
-        return fig
+        return _perf_placeholder_figure("No perf data available", title)
 
     # Organize by producer count: {producer_count: [(queue_size, value), ...]}
     by_producer: dict[int, list[tuple[int, int]]] = defaultdict(list)
@@ -739,54 +890,49 @@ def _plot_perf_metric_multiline(perf_rows: list[dict[str, Any]], metric_key: str
 
     has_data = any(v > 0 for pts in by_producer.values() for _, v in pts)
     if not has_data and metric_key in ('l2_dtlb_misses', 'l2_itlb_misses'):
-        fig = go.Figure()
-        fig.add_annotation(
-            text=f"No {metric_key} data (counter may not be supported on this CPU)",
-            xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False
-        )
-        fig.update_layout(template="plotly_white", width=1100, height=600, title=title)
-        return fig
+        return _perf_placeholder_figure(f"No {metric_key} data (counter may not be supported on this CPU)", title)
 
     producer_counts = sorted(by_producer.keys())
     queue_sizes = sorted(set(r['queue_size'] for r in perf_rows))
     tick_vals = [_queue_size_kb(qs) for qs in queue_sizes]
     tick_text = [_queue_size_kb_label(qs) for qs in queue_sizes]
-    colors = px.colors.sequential.Viridis
+    kb_by_queue_size = dict(zip(queue_sizes, tick_vals))
+    colors = _sample_colors('Viridis', len(producer_counts))
 
-    fig = go.Figure()
+    traces = []
     for i, producer_count in enumerate(producer_counts):
         pts = sorted(by_producer[producer_count], key=lambda x: x[0])
-        queue_sizes_pts = [_queue_size_kb(qs) for qs, _ in pts]
-        values = [v for _, v in pts]
-        fig.add_trace(
-            go.Scatter(
-                x=queue_sizes_pts,
-                y=values,
-                mode="lines+markers",
-                name=f"{producer_count} producer(s)",
-                line={"width": 2, "color": colors[i % len(colors)]},
-                marker={"size": 9, "symbol": "circle"},
-            )
+        # NumPy columns, so plotly ships them as base64 typed arrays rather than decimal JSON lists
+        points = _line_points(
+            np.fromiter((kb_by_queue_size[qs] for qs, _ in pts), dtype=np.float64, count=len(pts)),
+            np.fromiter((v for _, v in pts), dtype=np.int64, count=len(pts)),
         )
-
-    fig.update_layout(
-        template="plotly_white",
-        width=1100,
-        height=600,
-        title=title,
-        legend_title_text="Producer Count",
-        margin=dict(l=80, r=40, t=90, b=120),
-    )
-    fig.update_xaxes(
-        title_text="Queue Size (kB)",
-        type="log",
-        tickmode="array",
-        tickvals=tick_vals,
-        ticktext=tick_text,
-        tickangle=-45,
-    )
-    fig.update_yaxes(title_text=title.split("<br>")[0], rangemode="tozero")
-    return fig
+        traces.extend(_line_traces(
+            go.Scatter,
+            points,
+            name=f"{producer_count} producer(s)",
+            line={"width": 2, "color": colors[i % len(colors)]},
+            marker={"size": 9, "symbol": "circle"},
+        ))
+
+    layout = {
+        "template": _plot_template(),
+        "width": 1100,
+        "height": 600,
+        "title": {"text": title},
+        "legend": {"title": {"text": "Producer Count"}},
+        "margin": {"l": 80, "r": 40, "t": 90, "b": 120},
+        "xaxis": {
+            "title": {"text": "Queue Size (kB)"},
+            "type": "log",
+            "tickmode": "array",
+            "tickvals": tick_vals,
+            "ticktext": tick_text,
+            "tickangle": -45,
+        },
+        "yaxis": {"title": {"text": title.split("<br>")[0]}, "rangemode": "tozero"},
+    }
+    return go.Figure(data=traces, layout=layout, _validate=False)
 
 
 def plot_perf_dtlb_load_misses(perf_rows: list[dict[str, Any]]) -> go.Figure:
@@ -821,6 +967,88 @@ def plot_perf_l2_itlb_misses(perf_rows: list[dict[str, Any]]) -> go.Figure:
     )
 
 
+# Pickled (figures, cpu_info) of the last run, kept next to the inputs and keyed by _input_cache_key
+_FIGURE_CACHE_DIR = '.cache'
+
+
+def _input_cache_key(input_path: Path) -> str:
+    """
+    Short hash of the (path, mtime, size) of every file the report is built from, plus this script
+    and the plotly/numpy versions, so that touching any input, the plotting code or upgrading the
+    libraries the pickled figures depend on invalidates cached figures.
+    """
+    import plotly  # type: ignore[import-not-found]
+
+    if input_path.is_dir():
+        paths = [p for glob in (BENCHMARK_RESULTS_GLOB, TRACY_CSV_GLOB, PERF_TXT_GLOB) for p in input_path.glob(glob)]
+    else:
+        paths = [input_path]
+    paths.append(Path(__file__))
+    stats = sorted((str(p), st.st_mtime_ns, st.st_size) for p in paths for st in (p.stat(),))
+    key = (stats, plotly.__version__, np.__version__)
+    return hashlib.blake2b(repr(key).encode('utf-8'), digest_size=8).hexdigest()
+
+
+def _figure_cache_path(input_path: Path, cache_key: str) -> Path:
+    cache_dir = (input_path if input_path.is_dir() else input_path.parent) / _FIGURE_CACHE_DIR
+    return cache_dir / f'figures_{cache_key}.pkl'
+
+
+def _report_stamp_path(output_path: Path) -> Path:
+    """Sidecar recording the _input_cache_key the report at output_path was generated from."""
+    return output_path.with_name(output_path.name + '.sha')
+
+
+def _report_up_to_date(output_path: Path, cache_key: str) -> bool:
+    """True if output_path (and its plotly.js copy) was written from inputs matching cache_key."""
+    if not output_path.exists() or not (output_path.parent / _PLOTLY_JS_NAME).exists():
+        return False
+    try:
+        return _report_stamp_path(output_path).read_text(encoding='utf-8').strip() == cache_key
+    except OSError:
+        return False
+
+
+def _write_report(figures: list[go.Figure], output_path: Path, cpu_info: Any, cache_key: str | None) -> None:
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    stamp_path = _report_stamp_path(output_path)
+    # Drop the old stamp first, so a --no-cache or interrupted write can't leave one matching stale inputs
+    try:
+        stamp_path.unlink(missing_ok=True)
+    except OSError as e:
+        logging.warning("Could not remove %s: %s", stamp_path, e)
+    write_html_report(figures, output_path, cpu_info=cpu_info)
+    if cache_key is not None:
+        try:
+            stamp_path.write_text(cache_key + '\n', encoding='utf-8')
+        except OSError as e:
+            logging.warning("Could not write %s: %s", stamp_path, e)
+    logging.info("\nAll visualizations saved to %s", output_path)
+
+
+def _load_cached_figures(cache_path: Path) -> tuple[list[go.Figure], Any] | None:
+    try:
+        with cache_path.open('rb') as fh:
+            return pickle.load(fh)
+    except FileNotFoundError:
+        return None
+    except Exception as e:  # unpickling can raise nearly anything for a corrupt or foreign cache
+        logging.warning("Ignoring unreadable figure cache %s: %s", cache_path, e)
+        return None
+
+
+def _save_cached_figures(cache_path: Path, figures: list[go.Figure], cpu_info: Any) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Only the latest inputs are worth keeping
+        for stale in cache_path.parent.glob('figures_*.pkl'):
+            stale.unlink()
+        with cache_path.open('wb') as fh:
+            pickle.dump((figures, cpu_info), fh, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        logging.warning("Could not write figure cache %s: %s", cache_path, e)
+
+
 def main():
     logging.basicConfig(level=logging.INFO)
     script_dir = Path(__file__).parent
@@ -840,6 +1068,9 @@ def main():
     )
     parser.add_argument('-o', '--output', type=Path, default=default_output,
                         help=f'Output HTML path (default: {default_output})')
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'Always rebuild the report, instead of skipping it (or reusing {_FIGURE_CACHE_DIR}/ '
+                        'next to the input) when no input file has changed')
     args = parser.parse_args()
 
     input_path = args.input if args.input is not None else default_results_dir
@@ -849,57 +1080,86 @@ def main():
         logging.error("Error: %s not found!", input_path)
         return 1
 
-    if input_path.is_dir():
-        logging.info("Loading all benchmark results from %s (%s)...", input_path, BENCHMARK_RESULTS_GLOB)
-        results, cpu_info = load_all_benchmark_results(input_path)
-        if not results:
-            logging.error("Error: no %s files found in %s", BENCHMARK_RESULTS_GLOB, input_path)
-            return 1
-        logging.info("Total: %d benchmark results from all queue sizes", len(results))
-    else:
-        logging.info("Loading benchmark data from %s...", input_path)
-        payload = load_benchmark_json(input_path)
-        results = payload["benchmarkResults"]
-        cpu_info = payload.get("cpuInfo")
-        logging.info("Loaded %d benchmark results", len(results))
-
-    # Organize data
-    by_queue_size, by_producer_count = organize_data(results)
+    cache_key = None if args.no_cache else _input_cache_key(input_path)
+    if cache_key is not None and _report_up_to_date(output_path, cache_key):
+        logging.info("Inputs unchanged since %s was generated, nothing to do", output_path)
+        return 0
+    cache_path = None if cache_key is None else _figure_cache_path(input_path, cache_key)
+    cached = _load_cached_figures(cache_path) if cache_path is not None else None
+    if cached is not None:
+        figures, cpu_info = cached
+        logging.info("Inputs unchanged, reusing %d cached figures from %s", len(figures), cache_path)
+        _write_report(figures, output_path, cpu_info, cache_key)
+        return 0
+
+    tracy: pd.DataFrame | None = None
+    perf_rows: list[dict[str, Any]] = []
+    # The Tracy and perf loaders read disjoint files, so run them alongside the benchmark JSON load.
+    # Perf still starts after the benchmark results so it can reuse their (queue, producer) index.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        tracy_future: Future[pd.DataFrame] | None = None
+        perf_future: Future[list[dict[str, Any]]] | None = None
+        if input_path.is_dir():
+            if any(input_path.glob(TRACY_CSV_GLOB)):
+                logging.info("Loading Tracy CSV results from %s (%s)...", input_path, TRACY_CSV_GLOB)
+                tracy_future = executor.submit(load_all_tracy_csv, input_path)
+
+            logging.info("Loading all benchmark results from %s (%s)...", input_path, BENCHMARK_RESULTS_GLOB)
+            results, cpu_info, bench_index = load_all_benchmark_results(input_path)
+            if not results:
+                logging.error("Error: no %s files found in %s", BENCHMARK_RESULTS_GLOB, input_path)
+                return 1
+            logging.info("Total: %d benchmark results from all queue sizes", len(results))
+
+            if any(input_path.glob(PERF_TXT_GLOB)):
+                logging.info("Loading perf results from %s (%s)...", input_path, PERF_TXT_GLOB)
+                perf_future = executor.submit(load_all_perf_results, input_path, bench_index)
+        else:
+            logging.info("Loading benchmark data from %s...", input_path)
+            payload = load_benchmark_json(input_path)
+            results = benchmark_results(payload)
+            cpu_info = payload.get("cpuInfo")
+            del payload  # it would keep the results list alive past organize_data
+            logging.info("Loaded %d benchmark results", len(results))
+
+        if tracy_future is not None:
+            tracy = tracy_future.result()
+        if perf_future is not None:
+            perf_rows = perf_future.result()
+
+    # Organize data into typed columns and drop the per-result dicts; nothing below needs them.
+    throughput_df, queue_sizes, producer_counts = organize_data(results)
+    del results
 
     # Create benchmark visualizations
     logging.info("\nGenerating benchmark visualizations...")
     figures: List[go.Figure] = [
-        plot_queue_size_effect(by_queue_size),
-        plot_producer_count_effect(by_producer_count),
-        plot_heatmap(results),
+        plot_queue_size_effect(throughput_df, queue_sizes),
+        plot_producer_count_effect(throughput_df, producer_counts),
+        plot_heatmap(throughput_df, queue_sizes, producer_counts),
     ]
 
-    # Load Tracy CSVs from same directory (when input is a dir) and add Tracy figures
-    if input_path.is_dir():
-        tracy_paths = list(input_path.glob(TRACY_CSV_GLOB))
-        if tracy_paths:
-            logging.info("Loading Tracy CSV results from %s (%s)...", input_path, TRACY_CSV_GLOB)
-            tracy_rows = load_all_tracy_csv(input_path)
-            if tracy_rows:
-                logging.info("Generating Tracy visualizations (%d rows)...", len(tracy_rows))
-                figures.append(plot_tracy_push_mean_ns(tracy_rows))
-                figures.append(plot_tracy_pop_mean_ns(tracy_rows))
-                figures.append(plot_tracy_push_counts(tracy_rows))
-                figures.append(plot_tracy_pop_counts(tracy_rows))
-
-        # Load perf stat results and add TLB miss visualizations
-        perf_paths = list(input_path.glob(PERF_TXT_GLOB))
-        if perf_paths:
-            logging.info("Loading perf results from %s (%s)...", input_path, PERF_TXT_GLOB)
-            perf_rows = load_all_perf_results(input_path)
-            if perf_rows:
-                logging.info("Generating perf TLB visualizations (%d rows)...", len(perf_rows))
-                figures.append(plot_perf_dtlb_load_misses(perf_rows))
-                figures.append(plot_perf_itlb_load_misses(perf_rows))
-
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    write_html_report(figures, output_path, cpu_info=cpu_info)
-    logging.info("\nAll visualizations saved to %s", output_path)
+    # Tracy figures (Tracy CSVs from the same directory, when input is a dir)
+    if tracy is not None and not tracy.empty:
+        logging.info("Generating Tracy visualizations (%d rows)...", len(tracy))
+        grouped = _group_tracy(tracy, ('Push', 'Pop'))
+        push_mean_ns, push_counts = grouped['Push']
+        pop_mean_ns, pop_counts = grouped['Pop']
+        figures.append(plot_tracy_push_mean_ns(push_mean_ns))
+        figures.append(plot_tracy_pop_mean_ns(pop_mean_ns))
+        figures.append(plot_tracy_push_counts(push_counts))
+        figures.append(plot_tracy_pop_counts(pop_counts))
+
+    # Perf stat TLB miss visualizations
+    if perf_rows:
+        logging.info("Generating perf TLB visualizations (%d rows)...", len(perf_rows))
+        figures.append(plot_perf_dtlb_load_misses(perf_rows))
+        figures.append(plot_perf_itlb_load_misses(perf_rows))
+
+    if cache_path is not None:
+        _save_cached_figures(cache_path, figures, cpu_info)
+
+    _write_report(figures, output_path, cpu_info, cache_key)
     return 0
 
 